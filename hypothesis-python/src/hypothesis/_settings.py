@@ -20,6 +20,7 @@ import inspect
 import os
 import warnings
 from enum import Enum, EnumMeta, IntEnum, unique
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -51,6 +52,8 @@ __all__ = ["settings"]
 
 all_settings: Dict[str, "Setting"] = {}
 
+_BOOL_OPTIONS = (True, False)
+
 T = TypeVar("T")
 
 
@@ -64,15 +67,7 @@ class settingsProperty:
             return self
         else:
             try:
-                result = obj.__dict__[self.name]
-                # This is a gross hack, but it preserves the old behaviour that
-                # you can change the storage directory and it will be reflected
-                # in the default database.
-                if self.name == "database" and result is not_set:
-                    from hypothesis.database import ExampleDatabase
-
-                    result = ExampleDatabase(not_set)
-                return result
+                return obj.__dict__[self.name]
             except KeyError:
                 raise AttributeError(self.name) from None
 
@@ -93,6 +88,21 @@ class settingsProperty:
         return f"{description}\n\ndefault value: ``{default}``"
 
 
+class databaseProperty(settingsProperty):
+    def __get__(self, obj, type=None):
+        result = super().__get__(obj, type)
+        # This is a gross hack, but it preserves the old behaviour that
+        # you can change the storage directory and it will be reflected
+        # in the default database.  Only the bare default-profile settings
+        # object stores not_set; everything constructed from it caches a
+        # materialized database in __init__, skipping this branch.
+        if result is not_set and obj is not None:
+            from hypothesis.database import ExampleDatabase
+
+            result = ExampleDatabase(not_set)
+        return result
+
+
 default_variable = DynamicVariable(None)
 
 
@@ -102,7 +112,12 @@ class settingsMeta(type):
 
     @property
     def default(cls):
-        v = default_variable.value
+        # settings.default is read for essentially every @given test, so
+        # reach into the thread-local directly rather than paying for the
+        # DynamicVariable.value property dispatch.  A plain module-level
+        # mirror would be cheaper still, but would leak local_settings()
+        # overrides across threads.
+        v = getattr(default_variable.data, "value", None)
         if v is not None:
             return v
         if hasattr(settings, "_current_profile"):
@@ -141,11 +156,18 @@ class settings(metaclass=settingsMeta):
     _profiles: ClassVar[Dict[str, "settings"]] = {}
     __module__ = "hypothesis"
 
+    # Note: we deliberately don't declare __slots__ here.  Settings are
+    # defined via _define_setting *after* this class body runs, and both
+    # settingsProperty and the bulk-copy fast path in __init__ store the
+    # validated values in the instance __dict__.  There are only a handful
+    # of live settings objects at any time, so the per-instance dict costs
+    # us very little.
+
     def __getattr__(self, name):
-        if name in all_settings:
+        try:
             return all_settings[name].default
-        else:
-            raise AttributeError(f"settings has no attribute {name}")
+        except KeyError:
+            raise AttributeError(f"settings has no attribute {name}") from None
 
     def __init__(
         self,
@@ -177,16 +199,34 @@ class settings(metaclass=settingsMeta):
                 )
             database = None
 
+        # Collect only the arguments which were actually passed, so that the
+        # hot path below validates those and bulk-copies everything else.
+        provided = {
+            name: value
+            for name, value in locals().items()
+            if name in all_settings and value is not not_set
+        }
+
         defaults = parent or settings.default
         if defaults is not None:
-            for setting in all_settings.values():
-                value = locals()[setting.name]
-                if value is not_set:
-                    object.__setattr__(
-                        self, setting.name, getattr(defaults, setting.name)
-                    )
-                else:
-                    object.__setattr__(self, setting.name, setting.validator(value))
+            # Values stored on an existing settings object have already been
+            # validated, so we can copy them across in one step rather than
+            # dispatching on each of the eleven settings in turn.
+            self.__dict__.update(defaults.__dict__)
+            # A repr cached on the parent would be stale for this object.
+            self.__dict__.pop("_cached_repr", None)
+            if len(self.__dict__) < len(all_settings):
+                # Only the bare default-profile object has unmaterialized
+                # values; anything built from it carries all of them.
+                for name in all_settings:
+                    self.__dict__[name] = getattr(defaults, name)
+            if self.__dict__["database"] is not_set:
+                # Go through the settingsProperty above, which materializes
+                # an inherited `not_set` into the default database so that
+                # repeated accesses return the same instance.
+                self.__dict__["database"] = defaults.database
+            for name, value in provided.items():
+                object.__setattr__(self, name, all_settings[name].validator(value))
 
     def __call__(self, test: T) -> T:
         """Make the settings object (self) an attribute of the test.
@@ -265,11 +305,29 @@ class settings(metaclass=settingsMeta):
             options = tuple(options)
             assert default in options
 
-            def validator(value):
-                if value not in options:
+            if options == _BOOL_OPTIONS:
+                # The boolean settings get two identity checks instead of
+                # a tuple scan - they're validated on every decoration.
+                # Values merely *equal* to a bool (0, 1, numpy bools, ...)
+                # have always been accepted too, so keep the equality
+                # check as a slow path before rejecting.
+                def validator(value):
+                    if value is True or value is False or value in options:
+                        return value
+                    msg = f"Invalid {name}, {value!r}. Valid options: {options!r}"
+                    raise InvalidArgument(msg)
+
+            else:
+                choices = frozenset(options)
+
+                def validator(value):
+                    try:
+                        if value in choices:
+                            return value
+                    except TypeError:  # pragma: no cover  # unhashable value
+                        pass
                     msg = f"Invalid {name}, {value!r}. Valid options: {options!r}"
                     raise InvalidArgument(msg)
-                return value
 
         else:
             assert validator is not None
@@ -280,7 +338,16 @@ class settings(metaclass=settingsMeta):
             default=default,
             validator=validator,
         )
-        setattr(settings, name, settingsProperty(name, show_default))
+        property_class = databaseProperty if name == "database" else settingsProperty
+        setattr(settings, name, property_class(name, show_default))
+
+    @classmethod
+    def _from_validated(cls, src: "settings") -> "settings":
+        """Structurally clone ``src``, whose values have already been
+        validated, without re-running the validator pipeline."""
+        obj = cls.__new__(cls)
+        obj.__dict__.update(src.__dict__)
+        return obj
 
     @classmethod
     def lock_further_definitions(cls):
@@ -289,20 +356,39 @@ class settings(metaclass=settingsMeta):
     def __setattr__(self, name, value):
         raise AttributeError("settings objects are immutable")
 
+    def _resolved_value(self, name):
+        # Read straight from the instance dict; per-attribute getattr would
+        # re-dispatch through the settingsProperty descriptors.  Fall back
+        # to getattr only for unmaterialized values (the bare default).
+        value = self.__dict__.get(name, not_set)
+        if value is not_set:
+            value = getattr(self, name)
+        return value
+
     def __repr__(self):
         from hypothesis.internal.conjecture.data import AVAILABLE_PROVIDERS
 
+        # Settings are immutable once constructed, so the repr can be
+        # computed once and reused.  Whether the experimental backend
+        # setting is shown depends on the mutable provider registry, so
+        # the cache is keyed on that flag.
+        show_backend = len(AVAILABLE_PROVIDERS) > 1
+        cached = self.__dict__.get("_cached_repr")
+        if cached is not None and cached[0] == show_backend:
+            return cached[1]
         bits = sorted(
-            f"{name}={getattr(self, name)!r}"
+            f"{name}={self._resolved_value(name)!r}"
             for name in all_settings
-            if (name != "backend" or len(AVAILABLE_PROVIDERS) > 1)  # experimental
+            if (name != "backend" or show_backend)  # experimental
         )
-        return "settings({})".format(", ".join(bits))
+        result = "settings({})".format(", ".join(bits))
+        self.__dict__["_cached_repr"] = (show_backend, result)
+        return result
 
     def show_changed(self):
         bits = []
         for name, setting in all_settings.items():
-            value = getattr(self, name)
+            value = self._resolved_value(name)
             if value != setting.default:
                 bits.append(f"{name}={value!r}")
         return ", ".join(sorted(bits, key=len))
@@ -326,6 +412,13 @@ class settings(metaclass=settingsMeta):
         parent (or settings.default, if parent is None).
         """
         check_type(str, name, "name")
+        if not kwargs and parent is not None:
+            check_type(settings, parent, "parent")
+            if all_settings.keys() <= parent.__dict__.keys():
+                # Already validated and fully materialized - copy it rather
+                # than re-running every validator over the same values.
+                settings._profiles[name] = settings._from_validated(parent)
+                return
         settings._profiles[name] = settings(parent=parent, **kwargs)
 
     @staticmethod
@@ -365,7 +458,9 @@ class Setting:
 
 
 def _max_examples_validator(x):
-    check_type(int, x, name="max_examples")
+    if type(x) is not int:
+        # Slow path, for error reporting and int subclasses.
+        check_type(int, x, name="max_examples")
     if x < 1:
         raise InvalidArgument(
             f"max_examples={x!r} should be at least one. You can disable "
@@ -405,7 +500,7 @@ shines when given minutes or hours to run.
 settings._define_setting(
     "derandomize",
     default=False,
-    options=(True, False),
+    options=_BOOL_OPTIONS,
     description="""
 If True, seed Hypothesis' random number generator using a hash of the test
 function, so that every run will test the same set of examples until you
@@ -420,10 +515,17 @@ nightly testing run.
 )
 
 
-def _validate_database(db):
+@lru_cache(maxsize=None)
+def _example_database_cls():
+    # Deferred import to avoid a cycle; cached so that repeated validations
+    # skip the sys.modules lookup and attribute access.
     from hypothesis.database import ExampleDatabase
 
-    if db is None or isinstance(db, ExampleDatabase):
+    return ExampleDatabase
+
+
+def _validate_database(db):
+    if db is None or isinstance(db, _example_database_cls()):
         return db
     raise InvalidArgument(
         "Arguments to the database setting must be None or an instance of "
@@ -458,14 +560,33 @@ class Phase(IntEnum):
     shrink = 4  #: controls whether examples will be shrunk.
     explain = 5  #: controls whether Hypothesis attempts to explain test failures.
 
+    _repr_cache: str
+
     def __repr__(self):
-        return f"Phase.{self.name}"
+        return self._repr_cache
+
+
+# Member reprs show up in error messages and verbose output, so cache the
+# formatted strings instead of re-evaluating the f-string on each call.
+for _phase in Phase:
+    _phase._repr_cache = f"Phase.{_phase.name}"
+del _phase
+
+
+#: All phases, in definition order.  Computed once here because iterating
+#: an enum goes through EnumMeta.__iter__ on every call, which is slow
+#: enough to matter on the per-decoration validation path.
+_AVAILABLE_PHASES = tuple(Phase)
 
 
 class HealthCheckMeta(EnumMeta):
+    # The non-deprecated members, in definition order.  Filled in just after
+    # the HealthCheck class body below, so that iteration doesn't rebuild
+    # the filtered sequence on every list(HealthCheck) call.
+    _active_members: tuple = ()
+
     def __iter__(self):
-        deprecated = (HealthCheck.return_value, HealthCheck.not_a_test_method)
-        return iter(x for x in super().__iter__() if x not in deprecated)
+        return iter(self._active_members)
 
 
 @unique
@@ -475,8 +596,10 @@ class HealthCheck(Enum, metaclass=HealthCheckMeta):
     Each member of this enum is a type of health check to suppress.
     """
 
+    _repr_cache: str
+
     def __repr__(self):
-        return f"{self.__class__.__name__}.{self.name}"
+        return self._repr_cache
 
     @classmethod
     def all(cls) -> List["HealthCheck"]:
@@ -487,7 +610,7 @@ class HealthCheck(Enum, metaclass=HealthCheckMeta):
             has_codemod=True,
             stacklevel=1,
         )
-        return list(HealthCheck)
+        return list(HealthCheckMeta._active_members)
 
     data_too_large = 1
     """Checks if too many examples are aborted for being too large.
@@ -549,6 +672,21 @@ class HealthCheck(Enum, metaclass=HealthCheckMeta):
     specified on leaf subclasses."""
 
 
+# Iterate via EnumMeta so the deprecated members get cached reprs too.
+for _health_check in EnumMeta.__iter__(HealthCheck):
+    _health_check._repr_cache = f"HealthCheck.{_health_check.name}"
+del _health_check
+
+
+_DEPRECATED_HEALTH_CHECKS = frozenset(
+    {HealthCheck.return_value, HealthCheck.not_a_test_method}
+)
+
+HealthCheckMeta._active_members = tuple(
+    x for x in EnumMeta.__iter__(HealthCheck) if x not in _DEPRECATED_HEALTH_CHECKS
+)
+
+
 @unique
 class Verbosity(IntEnum):
     quiet = 0
@@ -556,8 +694,15 @@ class Verbosity(IntEnum):
     verbose = 2
     debug = 3
 
+    _repr_cache: str
+
     def __repr__(self):
-        return f"Verbosity.{self.name}"
+        return self._repr_cache
+
+
+for _verbosity in Verbosity:
+    _verbosity._repr_cache = f"Verbosity.{_verbosity.name}"
+del _verbosity
 
 
 settings._define_setting(
@@ -569,16 +714,22 @@ settings._define_setting(
 
 
 def _validate_phases(phases):
+    if phases is _AVAILABLE_PHASES:
+        # e.g. phases=settings.default.phases, or an inherited default -
+        # already known to be valid and canonically ordered.
+        return phases
     phases = tuple(phases)
     for a in phases:
         if not isinstance(a, Phase):
             raise InvalidArgument(f"{a!r} is not a valid phase")
-    return tuple(p for p in list(Phase) if p in phases)
+    if phases == _AVAILABLE_PHASES:
+        return _AVAILABLE_PHASES
+    return tuple(p for p in _AVAILABLE_PHASES if p in phases)
 
 
 settings._define_setting(
     "phases",
-    default=tuple(Phase),
+    default=_AVAILABLE_PHASES,
     description=(
         "Control which phases should be run. "
         "See :ref:`the full documentation for more details <phases>`"
@@ -588,7 +739,8 @@ settings._define_setting(
 
 
 def _validate_stateful_step_count(x):
-    check_type(int, x, name="stateful_step_count")
+    if type(x) is not int:
+        check_type(int, x, name="stateful_step_count")
     if x < 1:
         raise InvalidArgument(f"stateful_step_count={x!r} must be at least one.")
     return x
@@ -606,7 +758,7 @@ Number of steps to run a stateful program for before giving up on it breaking.
 settings._define_setting(
     name="report_multiple_bugs",
     default=True,
-    options=(True, False),
+    options=_BOOL_OPTIONS,
     description="""
 Because Hypothesis runs the test many times, it can sometimes find multiple
 bugs in a single run.  Reporting all of them at once is usually very useful,
@@ -617,14 +769,19 @@ If disabled, only the exception with the smallest minimal example is raised.
 
 
 def validate_health_check_suppressions(suppressions):
-    suppressions = try_convert(list, suppressions, "suppress_health_check")
+    # Almost everyone passes a list or tuple; skip try_convert's generality
+    # (and its try/except setup) for those.
+    if type(suppressions) is tuple:
+        suppressions = list(suppressions)
+    elif type(suppressions) is not list:
+        suppressions = try_convert(list, suppressions, "suppress_health_check")
     for s in suppressions:
         if not isinstance(s, HealthCheck):
             raise InvalidArgument(
                 f"Non-HealthCheck value {s!r} of type {type(s).__name__} "
                 "is invalid in suppress_health_check."
             )
-        if s in (HealthCheck.return_value, HealthCheck.not_a_test_method):
+        if s in _DEPRECATED_HEALTH_CHECKS:
             note_deprecation(
                 f"The {s.name} health check is deprecated, because this is always an error.",
                 since="2023-03-15",
@@ -650,17 +807,13 @@ class duration(datetime.timedelta):
         return f"timedelta(milliseconds={int(ms) if ms == int(ms) else ms!r})"
 
 
+_ZERO_TIMEDELTA = datetime.timedelta(0)
+
+
 def _validate_deadline(x):
     if x is None:
         return x
-    invalid_deadline_error = InvalidArgument(
-        f"deadline={x!r} (type {type(x).__name__}) must be a timedelta object, "
-        "an integer or float number of milliseconds, or None to disable the "
-        "per-test-case deadline."
-    )
-    if isinstance(x, (int, float)):
-        if isinstance(x, bool):
-            raise invalid_deadline_error
+    if isinstance(x, (int, float)) and not isinstance(x, bool):
         try:
             x = duration(milliseconds=x)
         except OverflowError:
@@ -669,13 +822,20 @@ def _validate_deadline(x):
                 "as a timedelta. Use deadline=None to disable deadlines."
             ) from None
     if isinstance(x, datetime.timedelta):
-        if x <= datetime.timedelta(0):
+        if x <= _ZERO_TIMEDELTA:
             raise InvalidArgument(
                 f"deadline={x!r} is invalid, because it is impossible to meet a "
                 "deadline <= 0. Use deadline=None to disable deadlines."
             )
+        if type(x) is duration:
+            # Already normalized - e.g. copied from another settings object.
+            return x
         return duration(seconds=x.total_seconds())
-    raise invalid_deadline_error
+    raise InvalidArgument(
+        f"deadline={x!r} (type {type(x).__name__}) must be a timedelta object, "
+        "an integer or float number of milliseconds, or None to disable the "
+        "per-test-case deadline."
+    )
 
 
 settings._define_setting(
@@ -695,17 +855,29 @@ Set this to ``None`` to disable this behaviour entirely.
 )
 
 
+_IS_IN_CI: Optional[bool] = None
+
+
 def is_in_ci() -> bool:
-    # GitHub Actions, Travis CI and AppVeyor have "CI"
-    # Azure Pipelines has "TF_BUILD"
-    return "CI" in os.environ or "TF_BUILD" in os.environ
+    global _IS_IN_CI
+    if _IS_IN_CI is None:
+        # GitHub Actions, Travis CI and AppVeyor have "CI"
+        # Azure Pipelines has "TF_BUILD"
+        _IS_IN_CI = "CI" in os.environ or "TF_BUILD" in os.environ
+    return _IS_IN_CI
+
+
+def _reset_is_in_ci_cache() -> None:
+    """Testing hook for code which manipulates the CI environment variables."""
+    global _IS_IN_CI
+    _IS_IN_CI = None
 
 
 settings._define_setting(
     "print_blob",
     default=is_in_ci(),
     show_default=False,
-    options=(True, False),
+    options=_BOOL_OPTIONS,
     description="""
 If set to ``True``, Hypothesis will print code for failing examples that can be used with
 :func:`@reproduce_failure <hypothesis.reproduce_failure>` to reproduce the failing example.
@@ -714,6 +886,11 @@ The default is ``True`` if the ``CI`` or ``TF_BUILD`` env vars are set, ``False`
 )
 
 
+# Caching successful validations is safe even though providers may be
+# registered or removed at runtime: lru_cache does not cache raised exceptions,
+# so an unknown name is re-checked on each attempt, and AVAILABLE_PROVIDERS
+# calls cache_clear() whenever it is mutated.
+@lru_cache(maxsize=16)
 def _backend_validator(value):
     from hypothesis.internal.conjecture.data import AVAILABLE_PROVIDERS
 
@@ -764,9 +941,7 @@ assert settings.default is not None
 
 # Check that the kwonly args to settings.__init__ is the same as the set of
 # defined settings - in case we've added or remove something from one but
-# not the other.
-assert set(all_settings) == {
-    p.name
-    for p in inspect.signature(settings.__init__).parameters.values()
-    if p.kind == inspect.Parameter.KEYWORD_ONLY
-}
+# not the other.  Every keyword-only argument defaults to not_set, so
+# __kwdefaults__ lists exactly those names without the cost of running
+# inspect.signature on every import.
+assert set(all_settings) == set(settings.__init__.__kwdefaults__)
@@ -1878,6 +1878,26 @@ class HypothesisProvider(PrimitiveProvider):
         return (sampler, forced_sign_bit, neg_clamper, pos_clamper, nasty_floats)
 
 
+class _ProviderRegistry(Dict[str, str]):
+    """A provider mapping which drops the cached ``backend=`` validations in
+    hypothesis._settings whenever it is mutated, so that registering or
+    removing a provider takes effect immediately."""
+
+    def _invalidate(self) -> None:
+        from hypothesis._settings import _backend_validator
+
+        _backend_validator.cache_clear()
+
+    def __setitem__(self, key: str, value: str) -> None:
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def pop(self, key: str, *args: Any) -> Any:
+        value = super().pop(key, *args)
+        self._invalidate()
+        return value
+
+
 # The set of available `PrimitiveProvider`s, by name.  Other libraries, such as
 # crosshair, can implement this interface and add themselves; at which point users
 # can configure which backend to use via settings.   Keys are the name of the library,
@@ -1885,9 +1905,9 @@ class HypothesisProvider(PrimitiveProvider):
 #
 # NOTE: this is a temporary interface.  We DO NOT promise to continue supporting it!
 #       (but if you want to experiment and don't mind breakage, here you go)
-AVAILABLE_PROVIDERS = {
-    "hypothesis": "hypothesis.internal.conjecture.data.HypothesisProvider",
-}
+AVAILABLE_PROVIDERS = _ProviderRegistry(
+    hypothesis="hypothesis.internal.conjecture.data.HypothesisProvider",
+)
 
 
 class ConjectureData:
@@ -11,6 +11,7 @@
 import math
 import sys
 from copy import deepcopy
+from functools import lru_cache
 
 import pytest
 
@@ -41,6 +42,19 @@ from tests.conjecture.common import (
 )
 
 
+# Interval sets for the string literals reused throughout this module; parse
+# each one once at import time rather than at every call site.  The cached
+# variant is for test bodies where the string is generated by Hypothesis.
+intervals_from_string = lru_cache(maxsize=256)(IntervalSet.from_string)
+INTERVALS_EMPTY = IntervalSet.from_string("")
+INTERVALS_A = IntervalSet.from_string("a")
+INTERVALS_ABC = IntervalSet.from_string("abc")
+INTERVALS_ABCD = IntervalSet.from_string("abcd")
+INTERVALS_ABCDEFG = IntervalSet.from_string("abcdefg")
+INTERVALS_BCDA = IntervalSet.from_string("bcda")
+INTERVALS_E = IntervalSet.from_string("e")
+
+
 # we max out at 128 bit integers in the *unbounded* case, but someone may
 # specify a bound with a larger magnitude. Ensure we calculate max children for
 # those cases correctly.
@@ -61,18 +75,18 @@ def test_compute_max_children_is_positive(ir_type_and_kwargs):
         # only possibility is the empty string
         (
             "string",
-            {"min_size": 0, "max_size": 100, "intervals": IntervalSet.from_string("")},
+            {"min_size": 0, "max_size": 100, "intervals": INTERVALS_EMPTY},
             1,
         ),
         (
             "string",
-            {"min_size": 0, "max_size": 0, "intervals": IntervalSet.from_string("abc")},
+            {"min_size": 0, "max_size": 0, "intervals": INTERVALS_ABC},
             1,
         ),
         # 3 possibilities for each character, 8 characters, 3 ** 8 possibilities.
         (
             "string",
-            {"min_size": 8, "max_size": 8, "intervals": IntervalSet.from_string("abc")},
+            {"min_size": 8, "max_size": 8, "intervals": INTERVALS_ABC},
             3**8,
         ),
         (
@@ -80,7 +94,7 @@ def test_compute_max_children_is_positive(ir_type_and_kwargs):
             {
                 "min_size": 2,
                 "max_size": 8,
-                "intervals": IntervalSet.from_string("abcd"),
+                "intervals": INTERVALS_ABCD,
             },
             sum(4**k for k in range(2, 8 + 1)),
         ),
@@ -89,7 +103,7 @@ def test_compute_max_children_is_positive(ir_type_and_kwargs):
             {
                 "min_size": 0,
                 "max_size": None,
-                "intervals": IntervalSet.from_string("a"),
+                "intervals": INTERVALS_A,
             },
             MAX_CHILDREN_EFFECTIVELY_INFINITE,
         ),
@@ -98,7 +112,7 @@ def test_compute_max_children_is_positive(ir_type_and_kwargs):
             {
                 "min_size": 0,
                 "max_size": 10_000,
-                "intervals": IntervalSet.from_string("abcdefg"),
+                "intervals": INTERVALS_ABCDEFG,
             },
             MAX_CHILDREN_EFFECTIVELY_INFINITE,
         ),
@@ -188,7 +202,7 @@ def test_compute_max_children(ir_type, kwargs, count_children):
 @given(st.text(min_size=1, max_size=1), st.integers(0, 100))
 def test_draw_string_single_interval_with_equal_bounds(s, n):
     data = fresh_data()
-    intervals = IntervalSet.from_string(s)
+    intervals = intervals_from_string(s)
     assert data.draw_string(intervals, min_size=n, max_size=n) == s * n
 
 
@@ -197,16 +211,14 @@ def test_draw_string_single_interval_with_equal_bounds(s, n):
 @example(
     (
         "string",
-        {"min_size": 0, "max_size": 0, "intervals": IntervalSet.from_string("abc")},
+        {"min_size": 0, "max_size": 0, "intervals": INTERVALS_ABC},
     )
 )
-@example(
-    ("string", {"min_size": 0, "max_size": 3, "intervals": IntervalSet.from_string("")})
-)
+@example(("string", {"min_size": 0, "max_size": 3, "intervals": INTERVALS_EMPTY}))
 @example(
     (
         "string",
-        {"min_size": 0, "max_size": 3, "intervals": IntervalSet.from_string("a")},
+        {"min_size": 0, "max_size": 3, "intervals": INTERVALS_A},
     )
 )
 # all combinations of float signs
@@ -265,7 +277,14 @@ def test_compute_max_children_and_all_children_agree(ir_type_and_kwargs):
     # all_children.
     cap = min(100_000, MAX_CHILDREN_EFFECTIVELY_INFINITE)
     assume(max_children < cap)
-    assert len(list(all_children(ir_type, kwargs))) == max_children
+    # count the children instead of reifying a list of up to cap elements,
+    # and stop early if the generator yields more than we expected.
+    count = 0
+    for _ in all_children(ir_type, kwargs):
+        count += 1
+        if count > max_children:
+            break
+    assert count == max_children
 
 
 # it's very hard to test that unbounded integer ranges agree with
@@ -281,6 +300,56 @@ def test_compute_max_children_unbounded_integer_ranges(min_value, max_value, fir
     assert first == next(all_children("integer", kwargs))
 
 
+# what test_ir_nodes ought to record for its draw sequence; independent of
+# the random instance, so built once rather than per example.
+EXPECTED_TREE_NODES = [
+    IRNode(
+        ir_type="float",
+        value=5.0,
+        kwargs={
+            "min_value": -10.0,
+            "max_value": 10.0,
+            "allow_nan": True,
+            "smallest_nonzero_magnitude": SMALLEST_SUBNORMAL,
+        },
+        was_forced=True,
+    ),
+    IRNode(
+        ir_type="boolean",
+        value=True,
+        kwargs={"p": 0.5},
+        was_forced=True,
+    ),
+    IRNode(
+        ir_type="string",
+        value="abbcccdddd",
+        kwargs={
+            "intervals": INTERVALS_ABCD,
+            "min_size": 0,
+            "max_size": None,
+        },
+        was_forced=True,
+    ),
+    IRNode(
+        ir_type="bytes",
+        value=bytes(8),
+        kwargs={"size": 8},
+        was_forced=True,
+    ),
+    IRNode(
+        ir_type="integer",
+        value=50,
+        kwargs={
+            "min_value": 0,
+            "max_value": 100,
+            "weights": None,
+            "shrink_towards": 0,
+        },
+        was_forced=True,
+    ),
+]
+
+
 @given(st.randoms())
 def test_ir_nodes(random):
     data = fresh_data(random=random)
@@ -288,60 +357,14 @@ def test_ir_nodes(random):
     data.draw_boolean(forced=True)
 
     data.start_example(42)
-    data.draw_string(IntervalSet.from_string("abcd"), forced="abbcccdddd")
+    data.draw_string(INTERVALS_ABCD, forced="abbcccdddd")
     data.draw_bytes(8, forced=bytes(8))
     data.stop_example()
 
     data.draw_integer(0, 100, forced=50)
 
     data.freeze()
-    expected_tree_nodes = [
-        IRNode(
-            ir_type="float",
-            value=5.0,
-            kwargs={
-                "min_value": -10.0,
-                "max_value": 10.0,
-                "allow_nan": True,
-                "smallest_nonzero_magnitude": SMALLEST_SUBNORMAL,
-            },
-            was_forced=True,
-        ),
-        IRNode(
-            ir_type="boolean",
-            value=True,
-            kwargs={"p": 0.5},
-            was_forced=True,
-        ),
-        IRNode(
-            ir_type="string",
-            value="abbcccdddd",
-            kwargs={
-                "intervals": IntervalSet.from_string("abcd"),
-                "min_size": 0,
-                "max_size": None,
-            },
-            was_forced=True,
-        ),
-        IRNode(
-            ir_type="bytes",
-            value=bytes(8),
-            kwargs={"size": 8},
-            was_forced=True,
-        ),
-        IRNode(
-            ir_type="integer",
-            value=50,
-            kwargs={
-                "min_value": 0,
-                "max_value": 100,
-                "weights": None,
-                "shrink_towards": 0,
-            },
-            was_forced=True,
-        ),
-    ]
-    assert data.examples.ir_tree_nodes == expected_tree_nodes
+    assert data.examples.ir_tree_nodes == EXPECTED_TREE_NODES
 
 
 @given(ir_nodes())
@@ -480,7 +503,7 @@ def test_data_with_changed_forced_value(node):
         ir_type="string",
         value="aaaa",
         kwargs={
-            "intervals": IntervalSet.from_string("bcda"),
+            "intervals": INTERVALS_BCDA,
             "min_size": 4,
             "max_size": None,
         },
@@ -591,7 +614,7 @@ def test_all_children_are_permitted_values(ir_type_and_kwargs):
             {
                 "min_size": 10,
                 "max_size": 20,
-                "intervals": IntervalSet.from_string("abcd"),
+                "intervals": INTERVALS_ABCD,
             },
             False,
         ),
@@ -601,20 +624,20 @@ def test_all_children_are_permitted_values(ir_type_and_kwargs):
             {
                 "min_size": 1,
                 "max_size": 3,
-                "intervals": IntervalSet.from_string("abcd"),
+                "intervals": INTERVALS_ABCD,
             },
             False,
         ),
         (
             "abcd",
             "string",
-            {"min_size": 1, "max_size": 10, "intervals": IntervalSet.from_string("e")},
+            {"min_size": 1, "max_size": 10, "intervals": INTERVALS_E},
             False,
         ),
         (
             "e",
             "string",
-            {"min_size": 1, "max_size": 10, "intervals": IntervalSet.from_string("e")},
+            {"min_size": 1, "max_size": 10, "intervals": INTERVALS_E},
             True,
         ),
         (b"a", "bytes", {"size": 2}, False),
@@ -682,7 +705,7 @@ def test_forced_nodes_are_trivial(node):
             ir_type="string",
             value="",
             kwargs={
-                "intervals": IntervalSet.from_string("abcd"),
+                "intervals": INTERVALS_ABCD,
                 "min_size": 0,
                 "max_size": None,
             },
@@ -692,7 +715,7 @@ def test_forced_nodes_are_trivial(node):
             ir_type="string",
             value="aaaa",
             kwargs={
-                "intervals": IntervalSet.from_string("bcda"),
+                "intervals": INTERVALS_BCDA,
                 "min_size": 4,
                 "max_size": None,
             },
@@ -830,7 +853,7 @@ def test_trivial_nodes(node):
             ir_type="string",
             value="d",
             kwargs={
-                "intervals": IntervalSet.from_string("abcd"),
+                "intervals": INTERVALS_ABCD,
                 "min_size": 1,
                 "max_size": None,
             },
@@ -169,6 +169,11 @@ def test_it_is_an_error_to_suppress_non_healthchecks():
         settings(suppress_health_check=[1])
 
 
+def test_suppressions_may_be_a_tuple():
+    s = settings(suppress_health_check=(HealthCheck.data_too_large,))
+    assert s.suppress_health_check == [HealthCheck.data_too_large]
+
+
 class ReturningRuleMachine(RuleBasedStateMachine):
     @rule()
     def r(self):
@@ -51,6 +51,14 @@ def test_phases_default_to_all():
     assert all_settings["phases"].default == tuple(Phase)
 
 
+def test_full_phase_tuples_are_canonicalized_by_identity():
+    default_phases = settings.default.phases
+    # Reusing the already-validated default tuple takes the identity fast
+    # path; an equal tuple is canonicalized to the same object.
+    assert settings(phases=default_phases).phases is default_phases
+    assert settings(phases=tuple(Phase)).phases is default_phases
+
+
 def test_does_not_reuse_saved_examples_if_reuse_not_in_phases():
     class BadDatabase(ExampleDatabase):
         def save(self, key, value):
@@ -20,7 +20,9 @@ from hypothesis._settings import (
     HealthCheck,
     Phase,
     Verbosity,
+    _reset_is_in_ci_cache,
     default_variable,
+    is_in_ci,
     local_settings,
     note_deprecation,
     settings,
@@ -482,6 +484,14 @@ def test_show_changed():
     assert s.show_changed() == "database=None, max_examples=999"
 
 
+def test_unmaterialized_settings_resolve_to_defaults():
+    # The bare default-profile object stores nothing in its instance dict,
+    # so repr and show_changed fall back to the registered defaults.
+    bare = settings.__new__(settings)
+    assert "max_examples=100" in repr(bare)
+    assert bare.show_changed() == ""
+
+
 def test_note_deprecation_checks_date():
     with pytest.warns(HypothesisDeprecationWarning) as rec:
         note_deprecation("This is bad", since="RELEASEDAY", has_codemod=False)
@@ -512,3 +522,17 @@ def test_deprecated_settings_not_in_settings_all_list():
     assert al == ls
     assert HealthCheck.return_value not in ls
     assert HealthCheck.not_a_test_method not in ls
+
+
+def test_is_in_ci_is_cached(monkeypatch):
+    monkeypatch.delenv("CI", raising=False)
+    monkeypatch.delenv("TF_BUILD", raising=False)
+    _reset_is_in_ci_cache()
+    assert not is_in_ci()
+    monkeypatch.setenv("CI", "true")
+    # The first call cached its answer, so the environment is not re-read.
+    assert not is_in_ci()
+    _reset_is_in_ci_cache()
+    assert is_in_ci()
+    # Drop the cached True before monkeypatch restores the real environment.
+    _reset_is_in_ci_cache()